@@ -1,7 +1,86 @@
 import hashlib
+import json
+import mmap
+import struct
+import threading
 import zlib
-import os 
-from pathlib import Path 
+import os
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+try:
+    import deflate
+except ImportError:
+    deflate = None
+
+
+# Level 1 keeps most of the ratio at several times the throughput, which
+# wins once a payload is big enough for compression to dominate the write
+FAST_COMPRESS_THRESHOLD = 1 << 20
+FAST_COMPRESS_LEVEL = 1
+
+STREAM_THRESHOLD = 1 << 20  # 1 MiB: stream or mmap objects bigger than this
+CHUNK_SIZE = 1 << 20
+
+
+def compress(data, level=6):
+    """Compress an object payload (libdeflate if available, else zlib)"""
+    if deflate is not None:
+        return deflate.zlib_compress(data, level)
+    return zlib.compress(data, level)
+
+
+def compress_parts(parts, level=6):
+    """Compress a sequence of buffers without concatenating them first"""
+    if deflate is not None:
+        # libdeflate is one-shot, so join once -- still a single copy
+        return deflate.zlib_compress(b''.join(parts), level)
+    compressor = zlib.compressobj(level)
+    out = [compressor.compress(part) for part in parts]
+    out.append(compressor.flush())
+    return b''.join(out)
+
+
+def decompress(data):
+    """Decompress an object payload (libdeflate if available, else zlib)"""
+    if deflate is not None:
+        # libdeflate is one-shot: retry with a bigger buffer until it fits.
+        # DeflateError doesn't distinguish a short buffer from a corrupt
+        # stream, so cap the retries at DEFLATE's ~1032:1 expansion bound
+        # and let zlib below raise its proper error for bad input
+        bufsize = max(len(data) * 4, 1 << 16)
+        while True:
+            try:
+                return deflate.zlib_decompress(data, bufsize)
+            except deflate.DeflateError:
+                if bufsize > len(data) * 1032 + 64:
+                    break
+                bufsize *= 2
+    return zlib.decompress(data)
+
+
+OBJ_TYPE_BYTES = {'blob': b'blob ', 'tree': b'tree ', 'commit': b'commit '}
+
+
+def object_header(obj_type, size):
+    """Build the 'type size\\0' header without Unicode formatting"""
+    return b'%s%d\0' % (OBJ_TYPE_BYTES[obj_type], size)
+
+
+def new_hash():
+    """Return a hasher for object ids (BLAKE3 if available, else SHA-NI-accelerated SHA-1)"""
+    if blake3 is not None:
+        return blake3.blake3()
+    return hashlib.new('sha1')
+
 
 def init_repo():
     os.makedirs('.mygit/objects',exist_ok=True)
@@ -10,35 +89,198 @@ def init_repo():
 
 def hash_object(data, obj_type):
     """Create hash from object data"""
-    header = f"{obj_type} {len(data)}".encode()
-    full_data = header + b'\0' + data
-    return hashlib.sha256(full_data).hexdigest()
+    h = new_hash()
+    h.update(object_header(obj_type, len(data)))
+    h.update(data)
+    return h.digest()
+
+
+_known_hashes = None
+
+
+def known_hashes():
+    """Hashes of objects already on disk, walked lazily on first write"""
+    global _known_hashes
+    if _known_hashes is None:
+        hashes = set()
+        try:
+            with os.scandir('.mygit/objects') as it:
+                for subdir in it:
+                    if len(subdir.name) == 2 and subdir.is_dir():
+                        hashes.update(subdir.name + name for name in os.listdir(subdir.path))
+        except FileNotFoundError:
+            pass
+        _known_hashes = hashes
+    return _known_hashes
+
+
+def object_exists(obj_hash):
+    """Check whether an object is already stored, without re-statting known ones"""
+    known = known_hashes()
+    if obj_hash in known:
+        return True
+    if obj_hash in load_pack_index():
+        return True
+    if os.path.exists(f".mygit/objects/{obj_hash[:2]}/{obj_hash[2:]}"):
+        known.add(obj_hash)
+        return True
+    return False
 
 
 def write_object(data, obj_type):
-    """Write object to .mygit/objects/"""
-    obj_hash = hash_object(data, obj_type)
-    header = f"{obj_type} {len(data)}".encode()
-    full_data = header + b'\0' + data
-    compressed = zlib.compress(full_data)
-
-    obj_dir = f".mygit/objects/{obj_hash[:2]}"
+    """Write object to .mygit/objects/, returning the raw digest"""
+    header = object_header(obj_type, len(data))
+    h = new_hash()
+    h.update(header)
+    h.update(data)
+    obj_hash = h.digest()
+    obj_hex = obj_hash.hex()
+    if object_exists(obj_hex):
+        return obj_hash
+
+    level = FAST_COMPRESS_LEVEL if len(data) > FAST_COMPRESS_THRESHOLD else 6
+    compressed = compress_parts((header, data), level)
+
+    obj_dir = f".mygit/objects/{obj_hex[:2]}"
     os.makedirs(obj_dir, exist_ok=True)
-    obj_path = f"{obj_dir}/{obj_hash[2:]}"
-
-    with open(obj_path, 'wb') as f:
-        f.write(compressed)
+    obj_path = f"{obj_dir}/{obj_hex[2:]}"
+
+    # Raw fd write: skips BufferedWriter overhead for a single os.write,
+    # and tmp + os.replace makes the object appear atomically. The tmp
+    # name is per-writer: pool workers hashing duplicate files may race
+    # to write the same object, and each needs its own rename source
+    tmp_path = f"{obj_path}.tmp.{os.getpid()}.{threading.get_native_id()}"
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        os.write(fd, compressed)
+    finally:
+        os.close(fd)
+    os.replace(tmp_path, obj_path)
+    known_hashes().add(obj_hex)
     return obj_hash
 
 
+PACK_DIR = '.mygit/objects/pack'
+_PACK_IDX_ENTRY = struct.Struct('<QI')  # offset, compressed length
+_pack_index = None
+
+
+def load_pack_index():
+    """Load every pack index: oid hex -> (pack path, offset, length)"""
+    global _pack_index
+    if _pack_index is None:
+        index = {}
+        n = len(new_hash().digest())
+        entry_size = n + _PACK_IDX_ENTRY.size
+        try:
+            names = sorted(os.listdir(PACK_DIR))
+        except FileNotFoundError:
+            names = []
+        for name in names:
+            if not name.endswith('.idx'):
+                continue
+            pack_path = os.path.join(PACK_DIR, name[:-4] + '.pack')
+            with open(os.path.join(PACK_DIR, name), 'rb') as f:
+                data = f.read()
+            for rec_off in range(0, len(data) - entry_size + 1, entry_size):
+                oid = data[rec_off:rec_off + n]
+                offset, length = _PACK_IDX_ENTRY.unpack_from(data, rec_off + n)
+                index[oid.hex()] = (pack_path, offset, length)
+        _pack_index = index
+    return _pack_index
+
+
+def read_packed_object(obj_hash):
+    """Fetch one object's decompressed payload from a pack file"""
+    entry = load_pack_index().get(obj_hash)
+    if entry is None:
+        raise FileNotFoundError(f"object {obj_hash} not found")
+    pack_path, offset, length = entry
+    with open(pack_path, 'rb') as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return decompress(mm[offset:offset + length])
+
+
+def repack():
+    """Fold loose objects into a pack file with a sidecar index"""
+    loose = []
+    try:
+        with os.scandir('.mygit/objects') as it:
+            subdirs = [d.path for d in it if len(d.name) == 2 and d.is_dir()]
+    except FileNotFoundError:
+        return
+    for subdir in subdirs:
+        for name in os.listdir(subdir):
+            if '.tmp' not in name:
+                loose.append((os.path.basename(subdir) + name, os.path.join(subdir, name)))
+    if not loose:
+        return
+    loose.sort()
+
+    chunks = []
+    records = []
+    offset = 0
+    pack_id = new_hash()
+    for oid_hex, path in loose:
+        with open(path, 'rb') as f:
+            compressed = f.read()
+        chunks.append(compressed)
+        records.append((oid_hex, offset, len(compressed)))
+        offset += len(compressed)
+        pack_id.update(bytes.fromhex(oid_hex))
+
+    os.makedirs(PACK_DIR, exist_ok=True)
+    base = os.path.join(PACK_DIR, f"pack-{pack_id.digest().hex()}")
+    pack_path = base + '.pack'
+    idx_parts = []
+    for oid_hex, off, length in records:
+        idx_parts.append(bytes.fromhex(oid_hex))
+        idx_parts.append(_PACK_IDX_ENTRY.pack(off, length))
+
+    # Pack before index before unlinking: a crash in between only leaves
+    # objects stored twice, never missing
+    with open(pack_path + '.tmp', 'wb') as f:
+        f.write(b''.join(chunks))
+    os.replace(pack_path + '.tmp', pack_path)
+    with open(base + '.idx.tmp', 'wb') as f:
+        f.write(b''.join(idx_parts))
+    os.replace(base + '.idx.tmp', base + '.idx')
+
+    index = load_pack_index()
+    for oid_hex, off, length in records:
+        index[oid_hex] = (pack_path, off, length)
+    for _, path in loose:
+        os.unlink(path)
+
+
 def read_object(obj_hash):
-    """Read object from .mygit/objects/"""
+    """Read object from .mygit/objects/ (loose first, then packs)"""
     obj_path = f".mygit/objects/{obj_hash[:2]}/{obj_hash[2:]}"
-    with open(obj_path, 'rb') as f:
-        compressed = f.read()
-    full_data = zlib.decompress(compressed)
-
-    null_idx = full_data.index(b'\0')
+    # Raw fd read: one open, one fstat, one read — no buffer layer
+    try:
+        fd = os.open(obj_path, os.O_RDONLY)
+    except FileNotFoundError:
+        full_data = read_packed_object(obj_hash)
+        return parse_object(full_data)
+    try:
+        size = os.fstat(fd).st_size
+        if size > STREAM_THRESHOLD:
+            # Map big objects so the decompressor reads pages on demand
+            # instead of copying the whole compressed blob first
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                full_data = decompress(mm)
+        else:
+            full_data = decompress(os.read(fd, size))
+    finally:
+        os.close(fd)
+    return parse_object(full_data)
+
+
+def parse_object(full_data):
+    """Split a decompressed object into (type, content)"""
+    # The header ('type size\0') always fits in the first 64 bytes, so
+    # bound the scan instead of searching the whole payload
+    null_idx = full_data.index(b'\0', 0, 64)
     header = full_data[:null_idx].decode()
     content = full_data[null_idx + 1:]
     obj_type, size = header.split()
@@ -46,46 +288,209 @@ def read_object(obj_hash):
 
 
 
-def hash_blob(filepath):
-    """Create blob object from file"""
+TREE_CACHE_PATH = '.mygit/tree_cache.json'
+_tree_cache = None
+
+
+def load_tree_cache():
+    """Load the blob stat cache, keyed abs_path -> [mtime_ns, size, ino, hash]"""
+    global _tree_cache
+    if _tree_cache is None:
+        try:
+            with open(TREE_CACHE_PATH, 'r') as f:
+                _tree_cache = json.load(f)
+        except (FileNotFoundError, ValueError):
+            _tree_cache = {}
+    return _tree_cache
+
+
+def save_tree_cache():
+    """Persist the blob stat cache atomically"""
+    if _tree_cache is None:
+        return
+    tmp_path = TREE_CACHE_PATH + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(_tree_cache, f)
+    os.replace(tmp_path, TREE_CACHE_PATH)
+
+
+def advise_sequential(fd):
+    """Hint one-pass sequential access to the kernel where supported"""
+    if hasattr(os, 'posix_fadvise'):
+        # Advice values are not flags: one call each
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_NOREUSE)
+
+
+def write_blob_from_file(filepath, size):
+    """Stream a large file into a blob object without buffering it whole"""
+    header = object_header('blob', size)
+    h = new_hash()
+    h.update(header)
     with open(filepath, 'rb') as f:
-        data = f.read()
-    return write_object(data, 'blob')
+        advise_sequential(f.fileno())
+        while chunk := f.read(CHUNK_SIZE):
+            h.update(chunk)
+        obj_hash = h.digest()
+        obj_hex = obj_hash.hex()
+        if object_exists(obj_hex):
+            return obj_hash
+
+        obj_dir = f".mygit/objects/{obj_hex[:2]}"
+        os.makedirs(obj_dir, exist_ok=True)
+        obj_path = f"{obj_dir}/{obj_hex[2:]}"
+
+        # Rewind and stream into the compressor (zlib here: libdeflate
+        # has no streaming API) writing the object file directly
+        f.seek(0)
+        compressor = zlib.compressobj(FAST_COMPRESS_LEVEL)
+        # Per-writer tmp name: see write_object on duplicate-object races
+        tmp_path = f"{obj_path}.tmp.{os.getpid()}.{threading.get_native_id()}"
+        with open(tmp_path, 'wb') as out:
+            out.write(compressor.compress(header))
+            while chunk := f.read(CHUNK_SIZE):
+                out.write(compressor.compress(chunk))
+            out.write(compressor.flush())
+        os.replace(tmp_path, obj_path)
+        known_hashes().add(obj_hex)
+    return obj_hash
+
+
+def hash_blob(filepath, st=None):
+    """Create blob object from file"""
+    if st is None:
+        st = os.stat(filepath)
+    cache = load_tree_cache()
+    key = os.path.abspath(filepath)
+    entry = cache.get(key)
+    if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size and entry[2] == st.st_ino:
+        return bytes.fromhex(entry[3])
+
+    if st.st_size > STREAM_THRESHOLD:
+        blob_hash = write_blob_from_file(filepath, st.st_size)
+    else:
+        # One-shot raw read: no Python-side buffer on top of the page cache
+        fd = os.open(filepath, os.O_RDONLY)
+        try:
+            advise_sequential(fd)
+            data = os.read(fd, st.st_size)
+        finally:
+            os.close(fd)
+        blob_hash = write_object(data, 'blob')
+    cache[key] = [st.st_mtime_ns, st.st_size, st.st_ino, blob_hash.hex()]
+    return blob_hash
 
 
 
+_hash_pool = None
+
+
+def get_hash_pool():
+    """Shared thread pool for hashing blobs (I/O and zlib release the GIL)"""
+    global _hash_pool
+    if _hash_pool is None:
+        _hash_pool = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _hash_pool
+
+
 def create_tree(directory='.'):
-    """Create tree object from directory"""
-    entries = []
-    
-    for item in sorted(os.listdir(directory)):
-        if item == '.mygit':  # Skip our git directory
-            continue
-        path = os.path.join(directory, item)
-
-        if os.path.isfile(path):
-            # File: create blob
-            blob_hash = hash_blob(path)
-            mode = '100644'
-            entries.append((mode, item, blob_hash))
-        elif os.path.isdir(path):
-            tree_hash = create_tree(path)
-            mode = '040000'
-            entries.append((mode, item, tree_hash))
-
-    # Build tree content
-    tree_content = b''
-    for mode, name, obj_hash in entries:
-        tree_content += mode.encode() + b' '
-        tree_content += name.encode() + b'\0'
-        tree_content += bytes.fromhex(obj_hash)  # Binary hash
-   
-    # Write tree object
-    return write_object(tree_content, 'tree')
+    """Create tree object from directory (iterative: no recursion limit)"""
+    pool = get_hash_pool()
+    dir_entries = {}
+    order = []
+    queue = deque([directory])
+
+    # Breadth-first scan: submit every file to the pool as it is seen,
+    # record subdirectories by path to resolve later
+    while queue:
+        current = queue.popleft()
+        order.append(current)
+        entries = []
+
+        with os.scandir(current) as it:
+            entries_raw = sorted(it, key=lambda e: e.name)
+
+        for entry in entries_raw:
+            if entry.name == '.mygit':  # Skip our git directory
+                continue
+
+            if entry.is_file(follow_symlinks=False):
+                # File: hash blob on the pool (reuse the DirEntry stat for the cache)
+                future = pool.submit(hash_blob, entry.path, entry.stat(follow_symlinks=False))
+                entries.append(('100644', entry.name, future))
+            elif entry.is_dir(follow_symlinks=False):
+                queue.append(entry.path)
+                entries.append(('040000', entry.name, entry.path))
+
+        dir_entries[current] = entries
+
+    # Deepest directories first, so every child hash resolves before its parent
+    tree_hashes = {}
+    for current in reversed(order):
+        parts = []
+        for mode, name, obj_hash in dir_entries[current]:
+            if isinstance(obj_hash, Future):
+                obj_hash = obj_hash.result()
+            elif isinstance(obj_hash, str):
+                obj_hash = tree_hashes[obj_hash]
+            parts.append(mode.encode() + b' ')
+            parts.append(name.encode() + b'\0')
+            parts.append(obj_hash)  # Already the raw digest
+        tree_hashes[current] = write_object(b''.join(parts), 'tree')
+
+    return tree_hashes[directory]
 
 
 import time
 
+COMMIT_GRAPH_PATH = '.mygit/commit-graph'
+_GRAPH_FIXED = struct.Struct('<QI')  # timestamp, payload length
+
+
+def append_commit_graph(oid, parent, timestamp, author_line, message):
+    """Append one commit record to the graph index"""
+    payload = author_line.encode() + b'\n' + message.encode()
+    record = oid + (parent or b'\0' * len(oid)) \
+        + _GRAPH_FIXED.pack(timestamp, len(payload)) + payload
+    with open(COMMIT_GRAPH_PATH, 'ab') as f:
+        f.write(record)
+
+
+def load_commit_graph():
+    """Load the graph index: oid -> (parent or None, timestamp, author, message)"""
+    try:
+        f = open(COMMIT_GRAPH_PATH, 'rb')
+    except FileNotFoundError:
+        return {}
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return {}
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    graph = {}
+    n = len(new_hash().digest())
+    no_parent = b'\0' * n
+    offset = 0
+    end = len(mm)
+    while offset + 2 * n + _GRAPH_FIXED.size <= end:
+        oid = mm[offset:offset + n]
+        parent = mm[offset + n:offset + 2 * n]
+        offset += 2 * n
+        timestamp, payload_len = _GRAPH_FIXED.unpack_from(mm, offset)
+        offset += _GRAPH_FIXED.size
+        if offset + payload_len > end:
+            # Torn trailing append: treat the partial record as absent --
+            # log() falls back to the object for any commit not in the graph
+            break
+        payload = mm[offset:offset + payload_len]
+        offset += payload_len
+        author_line, _, message = payload.decode().partition('\n')
+        graph[oid] = (None if parent == no_parent else parent,
+                      timestamp, author_line, message)
+    mm.close()
+    return graph
+
+
 def create_commit(tree_hash, parent_hash, message, author="User <user@example.com>"):
     """Create commit object"""
     timestamp = int(time.time())
@@ -97,9 +502,13 @@ def create_commit(tree_hash, parent_hash, message, author="User <user@example.co
     commit_content += f"author {author_line}\n"
     commit_content += f"committer {author_line}\n\n{message}\n"
     # Write commit object
-    return write_object(commit_content.encode(), 'commit')
+    commit_hash = write_object(commit_content.encode(), 'commit')
+    parent_raw = bytes.fromhex(parent_hash) if parent_hash else None
+    append_commit_graph(commit_hash, parent_raw, timestamp, author_line, message)
+    return commit_hash
 
 
+@lru_cache(maxsize=1)
 def get_current_branch():
     """Get name of current branch from HEAD"""
     head_path = '.mygit/HEAD'
@@ -114,6 +523,7 @@ def get_current_branch():
     return None  # Detached HEAD
 
 
+@lru_cache(maxsize=1)
 def get_current_commit():
     """Get hash of current commit"""
     branch = get_current_branch()
@@ -126,20 +536,58 @@ def get_current_commit():
     with open(branch_path, 'r') as f:
         return f.read().strip()
 
+def invalidate_refs():
+    """Drop memoized HEAD/branch state after a ref write"""
+    get_current_branch.cache_clear()
+    get_current_commit.cache_clear()
+
+
+_deferred_syncs = None
+
+
+@contextmanager
+def deferred_ref_sync():
+    """Batch ref fsyncs: durable once at exit instead of per update"""
+    global _deferred_syncs
+    _deferred_syncs = set()
+    try:
+        yield
+    finally:
+        paths, _deferred_syncs = _deferred_syncs, None
+        for path in paths:
+            fd = os.open(path, os.O_RDONLY)
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+
+
 def update_branch(branch, commit_hash):
     """Update branch to point to commit"""
     branch_path = f'.mygit/refs/heads/{branch}'
-    with open(branch_path, 'w') as f:
+    # Write-to-tmp + rename so a crash can't leave a truncated ref
+    tmp_path = branch_path + '.tmp'
+    with open(tmp_path, 'w') as f:
         f.write(commit_hash)
+        if os.environ.get('GITC_UNSAFE') != '1':
+            if _deferred_syncs is not None:
+                _deferred_syncs.add(branch_path)
+            else:
+                f.flush()
+                os.fsync(f.fileno())
+    os.replace(tmp_path, branch_path)
+    invalidate_refs()
 
 
 def commit(message):
     """Create a commit from current directory"""
     tree_hash = create_tree('.')
     parent_hash = get_current_commit()
-    commit_hash = create_commit(tree_hash, parent_hash, message)
+    commit_hash = create_commit(tree_hash.hex(), parent_hash, message).hex()
     branch = get_current_branch() or 'main'
     update_branch(branch, commit_hash)
+    save_tree_cache()
+    repack()
     return commit_hash
 
 
@@ -149,6 +597,7 @@ def init():
     # Set HEAD to point to main branch
     with open('.mygit/HEAD', 'w') as f:
         f.write('ref: refs/heads/main')
+    invalidate_refs()
     print("Initialized empty repository in .mygit/")
 
 
@@ -173,54 +622,46 @@ def checkout(branch_name):
         return
     with open('.mygit/HEAD', 'w') as f:
         f.write(f'ref: refs/heads/{branch_name}')
+    invalidate_refs()
     print(f"Switched to branch '{branch_name}'")
 
 
 
-if __name__ == '__main__':
-    import sys
-    
-    if len(sys.argv) < 2:
-        print("Usage: python mygit.py <command> [args]")
-        sys.exit(1)
-    
-    cmd = sys.argv[1]
-
-    if cmd == 'init':
-        init()
-    elif cmd == 'commit':
-        msg = sys.argv[2] if len(sys.argv) > 2 else "No message"
-        commit(msg)
-        print(f"Committed")
-    elif cmd == 'branch':
-        create_branch(sys.argv[2])
-    elif cmd == 'checkout':
-        checkout(sys.argv[2])
-    elif cmd == 'log':
-        log()
-
-
 def log():
     """Show commit history"""
     commit_hash = get_current_commit()
     if not commit_hash:
         print("No commits yet")
         return
-    
-    while commit_hash:
-        obj_type, content = read_object(commit_hash)
-        lines = content.decode().split('\n')
-        print(f"commit {commit_hash}")
-        for line in lines:
+
+    graph = load_commit_graph()
+    oid = bytes.fromhex(commit_hash)
+    while oid:
+        if oid in graph:
+            parent, timestamp, author_line, message = graph[oid]
+            print(f"commit {oid.hex()}")
+            print(f"Author: {author_line}")
+            for line in message.split('\n'):
+                if line:
+                    print(f"    {line}")
+            print()
+            oid = parent
+            continue
+
+        # Commit predates the graph index: parse the object itself
+        obj_type, content = read_object(oid.hex())
+        text = content.decode()
+        print(f"commit {oid.hex()}")
+        parent_hex = None
+        for line in text.split('\n'):
             if line.startswith('parent '):
-                commit_hash = line.split()[1]
+                parent_hex = line.split()[1]
             elif line.startswith('author '):
                 print(f"Author: {line[7:]}")
             elif line and not line.startswith(('tree', 'committer')):
                 print(f"    {line}")
         print()
-        if 'parent ' not in content.decode():
-            break
+        oid = bytes.fromhex(parent_hex) if parent_hex else None
 
 
 def cat_file(obj_hash, show_type=False, show_size=False):  # ← NEW function
@@ -242,4 +683,27 @@ def cat_file(obj_hash, show_type=False, show_size=False):  # ← NEW function
     if obj_type == 'blob':
         print(content.decode())
     elif obj_type == 'commit':
-        print(content.decode())
\ No newline at end of file
+        print(content.decode())
+
+
+if __name__ == '__main__':
+    import sys
+    
+    if len(sys.argv) < 2:
+        print("Usage: python mygit.py <command> [args]")
+        sys.exit(1)
+    
+    cmd = sys.argv[1]
+
+    if cmd == 'init':
+        init()
+    elif cmd == 'commit':
+        msg = sys.argv[2] if len(sys.argv) > 2 else "No message"
+        commit(msg)
+        print(f"Committed")
+    elif cmd == 'branch':
+        create_branch(sys.argv[2])
+    elif cmd == 'checkout':
+        checkout(sys.argv[2])
+    elif cmd == 'log':
+        log()